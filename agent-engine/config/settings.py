@@ -20,6 +20,17 @@ class Settings(BaseSettings):
     postgres_db: str = "agent_system"
     max_concurrent_tasks: int = 5
     task_timeout_seconds: int = 3600
+    shutdown_grace_seconds: float = 30.0
+    task_lease_seconds: float = 120.0
+    task_heartbeat_seconds: float = 30.0
+    task_max_attempts: int = 3
+    queue_poll_interval_seconds: float = 0.5
+    http2_upstreams: str = ""
+    context_build_deadline_seconds: float = 20.0
+    event_batch_size: int = 100
+    event_flush_interval_seconds: float = 0.05
+    event_buffer_max: int = 5000
+    event_overflow_policy: Literal["merge", "drop"] = "merge"
     log_level: str = "INFO"
     internal_dashboard_api_url: str = "http://internal-dashboard-api:5000"
     dashboard_api_url: str = "http://dashboard-api:5000"
@@ -52,6 +63,10 @@ class Settings(BaseSettings):
     def improve_keyword_set(self) -> set[str]:
         return {k.strip().lower() for k in self.bot_improve_keywords.split(",") if k.strip()}
 
+    @property
+    def http2_upstream_set(self) -> set[str]:
+        return {u.strip() for u in self.http2_upstreams.split(",") if u.strip()}
+
     @property
     def redis_url(self) -> str:
         return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
@@ -9,7 +9,9 @@ import uvicorn
 from config import get_settings
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
+from services import http_clients
 from services.knowledge import KnowledgeService, NoopKnowledgeService
+from services.task_queue import enqueue_task
 from worker import TaskWorker
 
 logger = structlog.get_logger(__name__)
@@ -24,6 +26,7 @@ knowledge_service: KnowledgeService | NoopKnowledgeService | None = None
 async def lifespan(app: FastAPI):
     global worker, knowledge_service
     settings = get_settings()
+    http_clients.configure_http2(settings.http2_upstream_set)
 
     if settings.knowledge_services_enabled:
         knowledge_service = KnowledgeService(
@@ -62,6 +65,7 @@ async def lifespan(app: FastAPI):
     worker_task.cancel()
     with suppress(asyncio.CancelledError):
         await worker_task
+    await http_clients.aclose_all()
     logger.info("agent_engine_shutdown")
 
 
@@ -149,6 +153,10 @@ def create_app() -> FastAPI:
             result["knowledge_services"]["llamaindex"] = ks_status.llamaindex_available
             result["knowledge_services"]["gkg"] = ks_status.gkg_available
 
+        if worker:
+            result["scheduler"] = await worker.get_stats()
+        result["http_clients"] = http_clients.get_metrics()
+
         return result
 
     @app.get("/status")
@@ -183,7 +191,6 @@ def create_app() -> FastAPI:
 
     @app.post("/tasks")
     async def create_task(task: dict[str, Any]):
-        import json
         import uuid
 
         settings = get_settings()
@@ -192,7 +199,7 @@ def create_app() -> FastAPI:
         task_id = str(uuid.uuid4())
         task["task_id"] = task_id
 
-        await redis_client.lpush("agent:tasks", json.dumps(task))
+        await enqueue_task(redis_client, task)
         await redis_client.aclose()
 
         return JSONResponse(
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+StageFn = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class Stage:
+    name: str
+    run: StageFn
+    depends_on: tuple[str, ...] = ()
+    fallback: Any = None
+
+
+@dataclass
+class PipelineResult:
+    results: dict[str, Any] = field(default_factory=dict)
+    timings: dict[str, dict[str, Any]] = field(default_factory=dict)
+    total_ms: float = 0.0
+
+    def status(self, name: str) -> str:
+        return self.timings.get(name, {}).get("status", "pending")
+
+
+class StageSkippedError(Exception):
+    pass
+
+
+async def run_pipeline(
+    stages: list[Stage], deadline_seconds: float, log_context: dict[str, Any] | None = None
+) -> PipelineResult:
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        missing = [dep for dep in stage.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(f"Stage {stage.name} depends on unknown stages: {missing}")
+
+    result = PipelineResult()
+    log_context = log_context or {}
+    pipeline_start = time.perf_counter()
+    tasks: dict[str, asyncio.Task[Any]] = {}
+
+    def _finish(stage: Stage, status: str, started: float, value: Any) -> Any:
+        result.timings[stage.name] = {
+            "status": status,
+            "ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        result.results[stage.name] = value
+        return value
+
+    async def _run_stage(stage: Stage) -> Any:
+        for dep in stage.depends_on:
+            await asyncio.wait([tasks[dep]])
+            if result.status(dep) != "ok":
+                _finish(stage, "skipped", time.perf_counter(), stage.fallback)
+                raise StageSkippedError(dep)
+
+        started = time.perf_counter()
+        try:
+            value = await stage.run(result.results)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("context_stage_failed", stage=stage.name, error=str(e), **log_context)
+            _finish(stage, "failed", started, stage.fallback)
+            raise
+        return _finish(stage, "ok", started, value)
+
+    for stage in stages:
+        tasks[stage.name] = asyncio.create_task(_run_stage(stage))
+
+    _, pending = await asyncio.wait(tasks.values(), timeout=deadline_seconds)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    for task in tasks.values():
+        if not task.cancelled():
+            task.exception()
+
+    for stage in stages:
+        if stage.name not in result.timings:
+            result.timings[stage.name] = {"status": "timeout", "ms": None}
+            result.results[stage.name] = stage.fallback
+            logger.warning("context_stage_timeout", stage=stage.name, **log_context)
+
+    result.total_ms = round((time.perf_counter() - pipeline_start) * 1000, 1)
+    return result
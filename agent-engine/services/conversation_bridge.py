@@ -1,6 +1,6 @@
 import re
 
-import httpx
+from services import http_clients
 
 JIRA_KEY_PATTERN = re.compile(r"\b([A-Z][A-Z0-9]+-\d+)\b")
 
@@ -111,11 +111,13 @@ def build_conversation_title(task: dict) -> str:
     return f"{source.title()}: Unknown"
 
 
-async def _lookup_flow(client: httpx.AsyncClient, dashboard_url: str, flow_id: str) -> str | None:
+async def _lookup_flow(dashboard_url: str, flow_id: str) -> str | None:
     from urllib.parse import quote
 
     encoded = quote(flow_id, safe="")
-    response = await client.get(f"{dashboard_url}/api/conversations/by-flow/{encoded}")
+    response = await http_clients.request(
+        "dashboard", "GET", f"{dashboard_url}/api/conversations/by-flow/{encoded}"
+    )
     if response.status_code == 200:
         return response.json()["conversation_id"]
     return None
@@ -124,33 +126,34 @@ async def _lookup_flow(client: httpx.AsyncClient, dashboard_url: str, flow_id: s
 async def get_or_create_flow_conversation(dashboard_url: str, task: dict) -> str:
     flow_id = build_flow_id(task)
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        conversation_id = await _lookup_flow(client, dashboard_url, flow_id)
-        if conversation_id:
-            return conversation_id
-
-        if task.get("source") == "github":
-            jira_key = _extract_jira_key_from_github(task)
-            if jira_key:
-                jira_flow_id = f"jira:{jira_key}"
-                conversation_id = await _lookup_flow(client, dashboard_url, jira_flow_id)
-                if conversation_id:
-                    return conversation_id
-
-        title = build_conversation_title(task)
-        response = await client.post(
-            f"{dashboard_url}/api/conversations",
-            json={
-                "flow_id": flow_id,
-                "title": title,
-                "source": task.get("source", "webhook"),
-                "metadata": get_source_metadata(task),
-            },
-        )
-        response.raise_for_status()
-
-        data = response.json()
-        return data["conversation_id"]
+    conversation_id = await _lookup_flow(dashboard_url, flow_id)
+    if conversation_id:
+        return conversation_id
+
+    if task.get("source") == "github":
+        jira_key = _extract_jira_key_from_github(task)
+        if jira_key:
+            jira_flow_id = f"jira:{jira_key}"
+            conversation_id = await _lookup_flow(dashboard_url, jira_flow_id)
+            if conversation_id:
+                return conversation_id
+
+    title = build_conversation_title(task)
+    response = await http_clients.request(
+        "dashboard",
+        "POST",
+        f"{dashboard_url}/api/conversations",
+        json={
+            "flow_id": flow_id,
+            "title": title,
+            "source": task.get("source", "webhook"),
+            "metadata": get_source_metadata(task),
+        },
+    )
+    response.raise_for_status()
+
+    data = response.json()
+    return data["conversation_id"]
 
 
 async def fetch_conversation_context(
@@ -162,30 +165,32 @@ async def fetch_conversation_context(
     params: dict = {"max_messages": limit}
     if roles:
         params["roles"] = roles
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(
-            f"{dashboard_url}/api/conversations/{conversation_id}/context",
-            params=params,
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await http_clients.request(
+        "dashboard",
+        "GET",
+        f"{dashboard_url}/api/conversations/{conversation_id}/context",
+        params=params,
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 async def register_task(dashboard_url: str, task: dict, conversation_id: str) -> None:
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.post(
-            f"{dashboard_url}/api/tasks",
-            json={
-                "task_id": task["task_id"],
-                "source": task.get("source", "webhook"),
-                "source_metadata": get_source_metadata(task),
-                "input_message": task.get("prompt", ""),
-                "assigned_agent": task.get("assigned_agent", "brain"),
-                "conversation_id": conversation_id,
-                "flow_id": build_flow_id(task),
-            },
-        )
-        response.raise_for_status()
+    response = await http_clients.request(
+        "dashboard",
+        "POST",
+        f"{dashboard_url}/api/tasks",
+        json={
+            "task_id": task["task_id"],
+            "source": task.get("source", "webhook"),
+            "source_metadata": get_source_metadata(task),
+            "input_message": task.get("prompt", ""),
+            "assigned_agent": task.get("assigned_agent", "brain"),
+            "conversation_id": conversation_id,
+            "flow_id": build_flow_id(task),
+        },
+    )
+    response.raise_for_status()
 
 
 def _build_jira_system_message(metadata: dict) -> str:
@@ -227,12 +232,13 @@ async def post_system_message(
     if task_id:
         body["task_id"] = task_id
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.post(
-            f"{dashboard_url}/api/conversations/{conversation_id}/messages",
-            json=body,
-        )
-        response.raise_for_status()
+    response = await http_clients.request(
+        "dashboard",
+        "POST",
+        f"{dashboard_url}/api/conversations/{conversation_id}/messages",
+        json=body,
+    )
+    response.raise_for_status()
 
 
 async def post_fallback_notice(
@@ -257,8 +263,9 @@ async def post_fallback_notice(
     if task_id:
         body["task_id"] = task_id
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        await client.post(
-            f"{dashboard_url}/api/conversations/{conversation_id}/messages",
-            json=body,
-        )
+    await http_clients.request(
+        "dashboard",
+        "POST",
+        f"{dashboard_url}/api/conversations/{conversation_id}/messages",
+        json=body,
+    )
@@ -0,0 +1,175 @@
+import asyncio
+import json
+import time
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import redis.asyncio as redis
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+OverflowPolicy = Literal["merge", "drop"]
+
+LOW_VALUE_EVENT_TYPES = frozenset({"task:thinking"})
+MERGE_SEPARATOR = "\n\n"
+RETRY_BACKOFF_SECONDS = 0.5
+
+
+@dataclass
+class _PendingEvent:
+    key: str
+    event_type: str
+    fields: dict[str, str]
+    data: dict[str, Any] | None
+
+    def encode(self) -> dict[str, str]:
+        if self.data is None:
+            return self.fields
+        return {**self.fields, "data": json.dumps(self.data)}
+
+
+# One FIFO buffer drained by a single flusher keeps events ordered per key
+# (task_id / webhook_event_id). When the buffer is full, low-value events are
+# merged into the key's previous buffered event of the same type (or dropped)
+# and every other event waits for the flusher to make room.
+class BatchingEventPublisher:
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        *,
+        stream: str = "task_events",
+        max_batch_size: int = 100,
+        flush_interval_seconds: float = 0.05,
+        max_buffer_size: int = 5000,
+        overflow_policy: OverflowPolicy = "merge",
+        low_value_event_types: frozenset[str] = LOW_VALUE_EVENT_TYPES,
+    ):
+        self._redis = redis_client
+        self._stream = stream
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval_seconds
+        self._max_buffer_size = max_buffer_size
+        self._overflow_policy = overflow_policy
+        self._low_value = low_value_event_types
+        self._buffer: deque[_PendingEvent] = deque()
+        self._last_by_key: dict[str, _PendingEvent] = {}
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._flusher: asyncio.Task[None] | None = None
+        self._stats = {"published": 0, "batches": 0, "merged": 0, "dropped": 0, "failures": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._flusher is not None and not self._flusher.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._flusher = asyncio.create_task(self._run())
+
+    async def stop(self, drain_timeout_seconds: float = 5.0) -> None:
+        try:
+            await asyncio.wait_for(self.flush(), timeout=drain_timeout_seconds)
+        except TimeoutError:
+            logger.warning("event_batch_drain_timeout", dropped=len(self._buffer))
+        if self._flusher:
+            self._flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+
+    async def flush(self) -> None:
+        if not self.running:
+            return
+        self._wakeup.set()
+        await self._idle.wait()
+
+    async def publish(
+        self,
+        key: str,
+        event_type: str,
+        fields: dict[str, str],
+        data: dict[str, Any] | None = None,
+    ) -> None:
+        if len(self._buffer) >= self._max_buffer_size:
+            if event_type in self._low_value:
+                self._shed(key, event_type, data)
+                return
+            while len(self._buffer) >= self._max_buffer_size:
+                self._space.clear()
+                self._wakeup.set()
+                await self._space.wait()
+
+        pending = _PendingEvent(key=key, event_type=event_type, fields=fields, data=data)
+        self._buffer.append(pending)
+        self._last_by_key[key] = pending
+        self._idle.clear()
+        if len(self._buffer) >= self._max_batch_size:
+            self._wakeup.set()
+
+    def _shed(self, key: str, event_type: str, data: dict[str, Any] | None) -> None:
+        last = self._last_by_key.get(key)
+        if (
+            self._overflow_policy == "merge"
+            and last is not None
+            and last.event_type == event_type
+            and last.data is not None
+            and data is not None
+            and isinstance(last.data.get("content"), str)
+        ):
+            last.data["content"] += MERGE_SEPARATOR + str(data.get("content", ""))
+            self._stats["merged"] += 1
+            return
+        self._stats["dropped"] += 1
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            while self._buffer:
+                if not await self._flush_batch():
+                    await asyncio.sleep(RETRY_BACKOFF_SECONDS)
+                    break
+            if not self._buffer:
+                self._idle.set()
+
+    async def _flush_batch(self) -> bool:
+        count = min(len(self._buffer), self._max_batch_size)
+        batch = [self._buffer[i] for i in range(count)]
+        for pending in batch:
+            if self._last_by_key.get(pending.key) is pending:
+                del self._last_by_key[pending.key]
+        started = time.perf_counter()
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for pending in batch:
+                pipe.xadd(self._stream, pending.encode())
+            await pipe.execute()
+        except Exception as e:
+            self._stats["failures"] += 1
+            logger.warning("event_batch_flush_failed", size=count, error=str(e))
+            return False
+
+        for _ in range(count):
+            self._buffer.popleft()
+        self._stats["published"] += count
+        self._stats["batches"] += 1
+        self._space.set()
+        logger.debug(
+            "event_batch_flushed",
+            size=count,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+        return True
+
+    def get_stats(self) -> dict[str, int]:
+        return {**self._stats, "buffered": len(self._buffer)}
@@ -0,0 +1,158 @@
+import asyncio
+import importlib.util
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRYABLE_STATUS_CODES = {502, 503, 504}
+RETRY_BASE_DELAY_SECONDS = 0.2
+LATENCY_WINDOW = 256
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    timeout: float = 10.0
+    connect_timeout: float = 3.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    retries: int = 2
+
+
+UPSTREAMS: dict[str, UpstreamConfig] = {
+    "dashboard": UpstreamConfig(timeout=10.0),
+    "oauth": UpstreamConfig(timeout=5.0, max_connections=5, max_keepalive_connections=2),
+    "slack": UpstreamConfig(timeout=10.0),
+    "jira": UpstreamConfig(timeout=30.0),
+    "github": UpstreamConfig(timeout=30.0),
+    "knowledge": UpstreamConfig(timeout=15.0),
+}
+DEFAULT_UPSTREAM = UpstreamConfig()
+
+
+@dataclass
+class UpstreamMetrics:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    latencies_ms: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def record(self, started: float, error: bool) -> None:
+        self.requests += 1
+        self.errors += int(error)
+        self.latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    def snapshot(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies_ms)
+
+        def percentile(p: float) -> float | None:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 2)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "p50_ms": percentile(0.5),
+            "p95_ms": percentile(0.95),
+            "max_ms": round(ordered[-1], 2) if ordered else None,
+        }
+
+
+_clients: dict[str, httpx.AsyncClient] = {}
+_metrics: dict[str, UpstreamMetrics] = {}
+_http2_upstreams: set[str] = set()
+
+
+def configure_http2(upstreams: set[str]) -> None:
+    if upstreams and importlib.util.find_spec("h2") is None:
+        logger.warning("http2_unavailable", reason="h2 not installed", upstreams=sorted(upstreams))
+        return
+    _http2_upstreams.clear()
+    _http2_upstreams.update(upstreams)
+
+
+async def get_client(upstream: str) -> httpx.AsyncClient:
+    client = _clients.get(upstream)
+    if client is not None:
+        return client
+
+    config = UPSTREAMS.get(upstream, DEFAULT_UPSTREAM)
+    client = await httpx.AsyncClient(
+        timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        http2=upstream in _http2_upstreams,
+    ).__aenter__()
+
+    existing = _clients.setdefault(upstream, client)
+    if existing is not client:
+        await client.aclose()
+    return existing
+
+
+async def request(
+    upstream: str,
+    method: str,
+    url: str,
+    *,
+    retry: bool | None = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    client = await get_client(upstream)
+    config = UPSTREAMS.get(upstream, DEFAULT_UPSTREAM)
+    metrics = _metrics.setdefault(upstream, UpstreamMetrics())
+    method = method.upper()
+    should_retry = method in IDEMPOTENT_METHODS if retry is None else retry
+    attempts = 1 + (config.retries if should_retry else 0)
+    send = getattr(client, method.lower())
+
+    attempt = 1
+    while True:
+        started = time.perf_counter()
+        try:
+            response = await send(url, **kwargs)
+        except httpx.TransportError as e:
+            metrics.record(started, error=True)
+            if attempt >= attempts:
+                raise
+            logger.debug("http_retry", upstream=upstream, attempt=attempt, error=str(e))
+        else:
+            status = response.status_code
+            metrics.record(started, error=isinstance(status, int) and status >= 500)
+            if status not in RETRYABLE_STATUS_CODES or attempt >= attempts:
+                return response
+            logger.debug("http_retry", upstream=upstream, attempt=attempt, status=status)
+
+        metrics.retries += 1
+        await asyncio.sleep(random.uniform(0, RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)))
+        attempt += 1
+
+
+def get_metrics() -> dict[str, dict[str, Any]]:
+    return {
+        upstream: {**metrics.snapshot(), "pooled": upstream in _clients}
+        for upstream, metrics in _metrics.items()
+    }
+
+
+async def aclose_all() -> None:
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("http_client_close_failed", error=str(e))
@@ -4,6 +4,8 @@ from typing import Protocol, runtime_checkable
 import httpx
 import structlog
 
+from services import http_clients
+
 logger = structlog.get_logger(__name__)
 
 
@@ -80,30 +82,33 @@ class KnowledgeService:
             return []
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(
-                    f"{self._llamaindex_url}/query",
-                    json={
-                        "query": query,
-                        "org_id": org_id,
-                        "source_types": source_types or ["code", "jira", "confluence"],
-                        "top_k": top_k,
-                        "include_metadata": True,
-                    },
+            response = await http_clients.request(
+                "knowledge",
+                "POST",
+                f"{self._llamaindex_url}/query",
+                retry=self._retry_count > 0,
+                timeout=self._timeout,
+                json={
+                    "query": query,
+                    "org_id": org_id,
+                    "source_types": source_types or ["code", "jira", "confluence"],
+                    "top_k": top_k,
+                    "include_metadata": True,
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            return [
+                SearchResult(
+                    source_type=r.get("source_type", "unknown"),
+                    source_id=r.get("source_id", ""),
+                    content=r.get("content", ""),
+                    relevance_score=r.get("relevance_score", 0.0),
+                    metadata=r.get("metadata", {}),
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                return [
-                    SearchResult(
-                        source_type=r.get("source_type", "unknown"),
-                        source_id=r.get("source_id", ""),
-                        content=r.get("content", ""),
-                        relevance_score=r.get("relevance_score", 0.0),
-                        metadata=r.get("metadata", {}),
-                    )
-                    for r in data.get("results", [])
-                ]
+                for r in data.get("results", [])
+            ]
         except httpx.TimeoutException:
             logger.warning("knowledge_search_timeout", query=query[:50])
             return []
@@ -125,31 +130,34 @@ class KnowledgeService:
             return {}
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(
-                    f"{self._gkg_url}/graph/related",
-                    json={
-                        "entity": entity,
-                        "entity_type": entity_type,
-                        "org_id": org_id,
-                        "relationship": "all",
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                relationships: dict[str, list[GraphEntity]] = {}
-                for rel_type, entities in data.get("relationships", {}).items():
-                    relationships[rel_type] = [
-                        GraphEntity(
-                            name=e.get("name", ""),
-                            entity_type=e.get("type", ""),
-                            file_path=e.get("file"),
-                            line_number=e.get("line"),
-                        )
-                        for e in entities
-                    ]
-                return relationships
+            response = await http_clients.request(
+                "knowledge",
+                "POST",
+                f"{self._gkg_url}/graph/related",
+                retry=self._retry_count > 0,
+                timeout=self._timeout,
+                json={
+                    "entity": entity,
+                    "entity_type": entity_type,
+                    "org_id": org_id,
+                    "relationship": "all",
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            relationships: dict[str, list[GraphEntity]] = {}
+            for rel_type, entities in data.get("relationships", {}).items():
+                relationships[rel_type] = [
+                    GraphEntity(
+                        name=e.get("name", ""),
+                        entity_type=e.get("type", ""),
+                        file_path=e.get("file"),
+                        line_number=e.get("line"),
+                    )
+                    for e in entities
+                ]
+            return relationships
         except httpx.TimeoutException:
             logger.warning("knowledge_graph_timeout", entity=entity)
             return {}
@@ -167,18 +175,21 @@ class KnowledgeService:
             return self._status
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                try:
-                    resp = await client.get(f"{self._llamaindex_url}/health")
-                    self._status.llamaindex_available = resp.status_code == 200
-                except Exception:
-                    self._status.llamaindex_available = False
-
-                try:
-                    resp = await client.get(f"{self._gkg_url}/health")
-                    self._status.gkg_available = resp.status_code == 200
-                except Exception:
-                    self._status.gkg_available = False
+            try:
+                resp = await http_clients.request(
+                    "knowledge", "GET", f"{self._llamaindex_url}/health", retry=False, timeout=5.0
+                )
+                self._status.llamaindex_available = resp.status_code == 200
+            except Exception:
+                self._status.llamaindex_available = False
+
+            try:
+                resp = await http_clients.request(
+                    "knowledge", "GET", f"{self._gkg_url}/health", retry=False, timeout=5.0
+                )
+                self._status.gkg_available = resp.status_code == 200
+            except Exception:
+                self._status.gkg_available = False
 
         except Exception as e:
             self._status.last_check_error = str(e)
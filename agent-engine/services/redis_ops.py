@@ -4,6 +4,15 @@ from typing import Any
 
 import redis.asyncio as redis
 
+from services.event_batcher import BatchingEventPublisher
+
+_event_batcher: BatchingEventPublisher | None = None
+
+
+def set_event_batcher(batcher: BatchingEventPublisher | None) -> None:
+    global _event_batcher
+    _event_batcher = batcher
+
 
 async def update_task_status(
     redis_client: redis.Redis | None,
@@ -25,16 +34,15 @@ async def publish_task_event(
     event_type: str,
     data: dict[str, Any],
 ) -> None:
-    if redis_client:
-        await redis_client.xadd(
-            "task_events",
-            {
-                "type": event_type,
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "task_id": task_id,
-                "data": json.dumps(data),
-            },
-        )
+    fields = {
+        "type": event_type,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "task_id": task_id,
+    }
+    if _event_batcher and _event_batcher.running:
+        await _event_batcher.publish(task_id, event_type, fields, data)
+    elif redis_client:
+        await redis_client.xadd("task_events", {**fields, "data": json.dumps(data)})
 
 
 async def persist_output(redis_client: redis.Redis | None, task_id: str, output: str) -> None:
@@ -1,6 +1,6 @@
-import httpx
 import structlog
 
+from services import http_clients
 from services.conversation_bridge import get_source_metadata
 
 logger = structlog.get_logger(__name__)
@@ -79,12 +79,13 @@ async def _post_jira_comment(metadata: dict, output: str) -> dict[str, object]:
 
     body = _format_jira_response(output, metadata)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            f"{JIRA_API_URL}/api/v1/issues/{issue_key}/comments",
-            json={"body": body},
-        )
-        response.raise_for_status()
+    response = await http_clients.request(
+        "jira",
+        "POST",
+        f"{JIRA_API_URL}/api/v1/issues/{issue_key}/comments",
+        json={"body": body},
+    )
+    response.raise_for_status()
 
     comment_id = None
     try:
@@ -105,12 +106,13 @@ async def _post_github_comment(metadata: dict, output: str) -> dict[str, object]
 
     body = _format_github_response(output)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            f"{GITHUB_API_URL}/api/v1/repos/{repo}/issues/{number}/comments",
-            json={"body": body},
-        )
-        response.raise_for_status()
+    response = await http_clients.request(
+        "github",
+        "POST",
+        f"{GITHUB_API_URL}/api/v1/repos/{repo}/issues/{number}/comments",
+        json={"body": body},
+    )
+    response.raise_for_status()
 
     comment_id = None
     try:
@@ -133,16 +135,18 @@ async def _post_slack_message(task: dict, output: str) -> dict[str, object]:
 
     body = _format_slack_response(output)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            f"{SLACK_API_URL}/api/v1/messages",
-            json={
-                "channel": channel,
-                "text": body,
-                "thread_ts": thread_ts or None,
-            },
-        )
-        response.raise_for_status()
+    response = await http_clients.request(
+        "slack",
+        "POST",
+        f"{SLACK_API_URL}/api/v1/messages",
+        json={
+            "channel": channel,
+            "text": body,
+            "thread_ts": thread_ts or None,
+        },
+        timeout=30.0,
+    )
+    response.raise_for_status()
 
     comment_id = None
     try:
@@ -1,9 +1,10 @@
 import time
 from typing import Any
 
-import httpx
 import structlog
 
+from services import http_clients
+
 logger = structlog.get_logger(__name__)
 
 SOURCE_EMOJI = {
@@ -28,13 +29,14 @@ async def get_notification_channel(
         return _cached_channel
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(
-                f"{oauth_service_url}/internal/token/slack",
-                headers={"X-Internal-Service-Key": service_key},
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await http_clients.request(
+            "oauth",
+            "GET",
+            f"{oauth_service_url}/internal/token/slack",
+            headers={"X-Internal-Service-Key": service_key},
+        )
+        response.raise_for_status()
+        data = response.json()
 
         channel_id = data.get("metadata", {}).get("notification_channel_id")
         if channel_id:
@@ -157,12 +159,10 @@ async def _send(
         payload: dict[str, Any] = {"channel": channel, "text": text}
         if blocks:
             payload["blocks"] = blocks
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{slack_api_url}/api/v1/messages",
-                json=payload,
-            )
-            response.raise_for_status()
+        response = await http_clients.request(
+            "slack", "POST", f"{slack_api_url}/api/v1/messages", json=payload
+        )
+        response.raise_for_status()
         logger.info("slack_notification_sent", channel=channel)
         return True
     except Exception as e:
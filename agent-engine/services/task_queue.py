@@ -0,0 +1,266 @@
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+import redis.asyncio as redis
+
+LEGACY_QUEUE_KEY = "agent:tasks"
+READY_QUEUE_KEY = "agent:tasks:ready"
+FLOW_CLOCK_KEY = "agent:tasks:flow_clock"
+FLOW_CLOCK_TTL_SECONDS = 86400
+
+# Claimed tasks stay in LEASES_KEY (score = lease deadline) until acked. Expired
+# leases are requeued at their original score, or dead-lettered once
+# ATTEMPTS_KEY reaches the max attempts.
+LEASES_KEY = "agent:tasks:leases"
+LEASE_KEY_PREFIX = "agent:tasks:lease:"
+ATTEMPTS_KEY = "agent:tasks:attempts"
+DEAD_LETTER_KEY = "agent:tasks:dead"
+
+# Each flow (source + org) advances its own virtual clock by
+# FLOW_SERVICE_SECONDS / weight per task, so a burst from one flow is spread
+# out behind the tasks of quieter flows instead of blocking them.
+FLOW_SERVICE_SECONDS = 60.0
+SOURCE_WEIGHTS = {"slack": 4.0, "dashboard": 4.0, "github": 2.0, "jira": 1.0}
+DEFAULT_SOURCE_WEIGHT = 1.0
+
+# Priority lanes are a head start subtracted from the score. Scores are
+# wall-clock based, so a low-priority task can only be overtaken by work that
+# arrived less than this long after it, which bounds starvation (aging).
+PRIORITY_HEAD_START_SECONDS = {"high": 600.0, "normal": 120.0, "low": 0.0}
+DEFAULT_PRIORITY = "normal"
+
+HIGH_PRIORITY_SOURCES = {"slack", "dashboard"}
+LOW_PRIORITY_EVENTS = {("jira", "jira:issue_updated"), ("github", "push")}
+LOW_PRIORITY_GITHUB_ISSUE_ACTIONS = {"edited", "labeled"}
+
+_ENQUEUE_SCRIPT = """
+local now = tonumber(ARGV[3])
+local clock = tonumber(redis.call('HGET', KEYS[2], ARGV[2]) or '0')
+local start = math.max(clock, now)
+redis.call('HSET', KEYS[2], ARGV[2], tostring(start + tonumber(ARGV[4])))
+redis.call('EXPIRE', KEYS[2], tonumber(ARGV[6]))
+local score = start - tonumber(ARGV[5])
+redis.call('ZADD', KEYS[1], score, ARGV[1])
+return tostring(score)
+"""
+
+_CLAIM_SCRIPT = """
+local payload = redis.call('RPOP', KEYS[1])
+local score = ARGV[5]
+if not payload then
+  local popped = redis.call('ZPOPMIN', KEYS[2])
+  if #popped == 0 then
+    return nil
+  end
+  payload = popped[1]
+  score = popped[2]
+end
+local task_id = payload
+local ok, decoded = pcall(cjson.decode, payload)
+if ok and type(decoded) == 'table' and decoded['task_id'] then
+  task_id = tostring(decoded['task_id'])
+end
+local attempts = redis.call('HINCRBY', KEYS[4], task_id, 1)
+redis.call('HSET', ARGV[3] .. ARGV[1], 'payload', payload, 'score', score,
+  'task_id', task_id, 'worker', ARGV[4])
+redis.call('ZADD', KEYS[3], ARGV[2], ARGV[1])
+return {payload, attempts}
+"""
+
+_HEARTBEAT_SCRIPT = """
+local lost = {}
+for i = 2, #ARGV do
+  if redis.call('ZSCORE', KEYS[1], ARGV[i]) then
+    redis.call('ZADD', KEYS[1], ARGV[1], ARGV[i])
+  else
+    table.insert(lost, ARGV[i])
+  end
+end
+return lost
+"""
+
+_ACK_SCRIPT = """
+local lease_key = ARGV[2] .. ARGV[1]
+local task_id = redis.call('HGET', lease_key, 'task_id')
+local removed = redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('DEL', lease_key)
+if task_id then
+  redis.call('HDEL', KEYS[2], task_id)
+end
+return removed
+"""
+
+_REAP_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[4]))
+local dead = {}
+local requeued = 0
+for _, lease_id in ipairs(expired) do
+  local lease_key = ARGV[3] .. lease_id
+  local fields = redis.call('HMGET', lease_key, 'payload', 'score', 'task_id')
+  redis.call('ZREM', KEYS[1], lease_id)
+  redis.call('DEL', lease_key)
+  if fields[1] then
+    local attempts = tonumber(redis.call('HGET', KEYS[3], fields[3]) or '0')
+    if attempts >= tonumber(ARGV[2]) then
+      redis.call('LPUSH', KEYS[4], fields[1])
+      redis.call('HDEL', KEYS[3], fields[3])
+      table.insert(dead, fields[1])
+    else
+      redis.call('ZADD', KEYS[2], fields[2], fields[1])
+      requeued = requeued + 1
+    end
+  end
+end
+return {requeued, dead}
+"""
+
+
+@dataclass
+class ClaimedTask:
+    lease_id: str
+    payload: bytes
+    attempts: int
+
+
+def classify_task(task_info: dict[str, Any]) -> str:
+    explicit = task_info.get("priority")
+    if explicit in PRIORITY_HEAD_START_SECONDS:
+        return explicit
+
+    source = task_info.get("source", "dashboard")
+    event_type = task_info.get("event_type")
+
+    if source in HIGH_PRIORITY_SOURCES:
+        return "high"
+    if (source, event_type) in LOW_PRIORITY_EVENTS:
+        return "low"
+    if (
+        source == "github"
+        and event_type == "issues"
+        and task_info.get("action") in LOW_PRIORITY_GITHUB_ISSUE_ACTIONS
+    ):
+        return "low"
+    return DEFAULT_PRIORITY
+
+
+def flow_key(task_info: dict[str, Any]) -> str:
+    source = task_info.get("source", "dashboard")
+    org: str | None = None
+
+    if source == "github":
+        full_name = (task_info.get("repository") or {}).get("full_name") or ""
+        org = full_name.split("/", 1)[0] or None
+    elif source == "jira":
+        project = ((task_info.get("issue") or {}).get("project")) or {}
+        org = project.get("key") or task_info.get("jira_base_url")
+    elif source == "slack":
+        org = task_info.get("team_id")
+
+    return f"{source}:{org or 'default'}"
+
+
+async def enqueue_task(redis_client: redis.Redis, task_info: dict[str, Any]) -> float:
+    priority = classify_task(task_info)
+    task_info["priority"] = priority
+    flow = flow_key(task_info)
+    cost = FLOW_SERVICE_SECONDS / SOURCE_WEIGHTS.get(
+        task_info.get("source", "dashboard"), DEFAULT_SOURCE_WEIGHT
+    )
+
+    score = await redis_client.eval(
+        _ENQUEUE_SCRIPT,
+        2,
+        READY_QUEUE_KEY,
+        FLOW_CLOCK_KEY,
+        json.dumps(task_info),
+        flow,
+        time.time(),
+        cost,
+        PRIORITY_HEAD_START_SECONDS[priority],
+        FLOW_CLOCK_TTL_SECONDS,
+    )
+    return float(score)
+
+
+async def claim_task(
+    redis_client: redis.Redis, worker_id: str, lease_seconds: float
+) -> ClaimedTask | None:
+    lease_id = uuid.uuid4().hex
+    now = time.time()
+    result = await redis_client.eval(
+        _CLAIM_SCRIPT,
+        4,
+        LEGACY_QUEUE_KEY,
+        READY_QUEUE_KEY,
+        LEASES_KEY,
+        ATTEMPTS_KEY,
+        lease_id,
+        now + lease_seconds,
+        LEASE_KEY_PREFIX,
+        worker_id,
+        now,
+    )
+    if not result:
+        return None
+    payload, attempts = result
+    return ClaimedTask(lease_id=lease_id, payload=payload, attempts=int(attempts))
+
+
+async def heartbeat_leases(
+    redis_client: redis.Redis, lease_ids: list[str], lease_seconds: float
+) -> list[str]:
+    if not lease_ids:
+        return []
+    lost = await redis_client.eval(
+        _HEARTBEAT_SCRIPT, 1, LEASES_KEY, time.time() + lease_seconds, *lease_ids
+    )
+    return [_as_str(lease_id) for lease_id in lost]
+
+
+async def ack_task(redis_client: redis.Redis, lease_id: str) -> bool:
+    acked = await redis_client.eval(
+        _ACK_SCRIPT, 2, LEASES_KEY, ATTEMPTS_KEY, lease_id, LEASE_KEY_PREFIX
+    )
+    return bool(acked)
+
+
+async def release_task(redis_client: redis.Redis, lease_id: str) -> None:
+    await redis_client.zadd(LEASES_KEY, {lease_id: 0}, xx=True)
+
+
+async def reap_expired_leases(
+    redis_client: redis.Redis, max_attempts: int, limit: int = 100
+) -> tuple[int, list[bytes]]:
+    requeued, dead = await redis_client.eval(
+        _REAP_SCRIPT,
+        4,
+        LEASES_KEY,
+        READY_QUEUE_KEY,
+        ATTEMPTS_KEY,
+        DEAD_LETTER_KEY,
+        time.time(),
+        max_attempts,
+        LEASE_KEY_PREFIX,
+        limit,
+    )
+    return int(requeued), list(dead)
+
+
+def _as_str(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+async def queue_depth(redis_client: redis.Redis) -> int:
+    ready = await redis_client.zcard(READY_QUEUE_KEY)
+    legacy = await redis_client.llen(LEGACY_QUEUE_KEY)
+    return ready + legacy
+
+
+async def lease_stats(redis_client: redis.Redis) -> dict[str, int]:
+    return {
+        "leased": await redis_client.zcard(LEASES_KEY),
+        "dead_letter": await redis_client.llen(DEAD_LETTER_KEY),
+    }
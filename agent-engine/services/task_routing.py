@@ -3,59 +3,64 @@ import os
 import re
 from typing import Any
 
-import httpx
 import structlog
 
+from services import http_clients
 from services.conversation_bridge import get_source_metadata
 
 logger = structlog.get_logger(__name__)
 
 POSTING_TOOLS = {"add_jira_comment", "add_issue_comment", "send_slack_message"}
 
+EMPTY_KNOWLEDGE_CONTEXT: dict[str, Any] = {"knowledge": "", "repos": [], "code_snippets": []}
+
 
 async def _fetch_knowledge_context(prompt: str, org_id: str) -> dict[str, Any]:
     llamaindex_url = os.getenv("LLAMAINDEX_URL", "http://llamaindex-service:8002")
     result: dict[str, Any] = {"knowledge": "", "repos": [], "code_snippets": []}
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            knowledge_task = client.post(
-                f"{llamaindex_url}/api/query",
-                json={"query": prompt, "org_id": org_id},
-            )
-            code_task = client.post(
-                f"{llamaindex_url}/api/code-search",
-                json={"query": prompt, "org_id": org_id, "limit": 10},
-            )
-            responses = await asyncio.gather(
-                knowledge_task,
-                code_task,
-                return_exceptions=True,
-            )
-
-            knowledge_resp = responses[0]
-            if not isinstance(knowledge_resp, Exception) and knowledge_resp.status_code == 200:
-                data = knowledge_resp.json()
-                result["knowledge"] = data.get("response", "")
-
-            code_resp = responses[1]
-            if not isinstance(code_resp, Exception) and code_resp.status_code == 200:
-                data = code_resp.json()
-                results = data.get("results", [])
-                seen_repos: set[str] = set()
-                for item in results:
-                    repo = item.get("repo", "")
-                    if repo and repo not in seen_repos:
-                        seen_repos.add(repo)
-                        result["repos"].append(repo)
-                    result["code_snippets"].append(
-                        {
-                            "repo": repo,
-                            "file_path": item.get("file_path", ""),
-                            "content": item.get("content", "")[:500],
-                            "score": item.get("score", 0),
-                        }
-                    )
+        knowledge_task = http_clients.request(
+            "knowledge",
+            "POST",
+            f"{llamaindex_url}/api/query",
+            json={"query": prompt, "org_id": org_id},
+        )
+        code_task = http_clients.request(
+            "knowledge",
+            "POST",
+            f"{llamaindex_url}/api/code-search",
+            json={"query": prompt, "org_id": org_id, "limit": 10},
+        )
+        responses = await asyncio.gather(
+            knowledge_task,
+            code_task,
+            return_exceptions=True,
+        )
+
+        knowledge_resp = responses[0]
+        if not isinstance(knowledge_resp, Exception) and knowledge_resp.status_code == 200:
+            data = knowledge_resp.json()
+            result["knowledge"] = data.get("response", "")
+
+        code_resp = responses[1]
+        if not isinstance(code_resp, Exception) and code_resp.status_code == 200:
+            data = code_resp.json()
+            results = data.get("results", [])
+            seen_repos: set[str] = set()
+            for item in results:
+                repo = item.get("repo", "")
+                if repo and repo not in seen_repos:
+                    seen_repos.add(repo)
+                    result["repos"].append(repo)
+                result["code_snippets"].append(
+                    {
+                        "repo": repo,
+                        "file_path": item.get("file_path", ""),
+                        "content": item.get("content", "")[:500],
+                        "score": item.get("score", 0),
+                    }
+                )
     except Exception:
         logger.warning("knowledge_context_fetch_failed", org_id=org_id)
 
@@ -96,8 +101,18 @@ def _is_duplicate_content(content: str, prompt: str) -> bool:
     return overlap > 0.6
 
 
+def get_org_id() -> str:
+    return os.getenv("ORG_ID", "default-org")
+
+
+async def fetch_task_knowledge(task: dict[str, Any]) -> dict[str, Any]:
+    return await _fetch_knowledge_context(task.get("prompt", ""), get_org_id())
+
+
 async def build_task_context(
-    task: dict[str, Any], conversation_context: list[dict] | None = None
+    task: dict[str, Any],
+    conversation_context: list[dict] | None = None,
+    knowledge_ctx: dict[str, Any] | None = None,
 ) -> str:
     from config import get_settings
 
@@ -105,14 +120,15 @@ async def build_task_context(
     event_type = task.get("event_type", "unknown")
     metadata = get_source_metadata(task)
     base_prompt = task.get("prompt", "")
-    org_id = os.getenv("ORG_ID", "default-org")
+    org_id = get_org_id()
 
     settings = get_settings()
     bot_mentions = settings.bot_mentions
     approve_command = settings.bot_approve_command
     improve_keywords = settings.bot_improve_keywords
 
-    knowledge_ctx = await _fetch_knowledge_context(base_prompt, org_id)
+    if knowledge_ctx is None:
+        knowledge_ctx = await _fetch_knowledge_context(base_prompt, org_id)
     knowledge_section = _format_knowledge_section(knowledge_ctx, org_id)
 
     context_section = ""
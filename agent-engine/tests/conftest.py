@@ -3,10 +3,21 @@
 from unittest.mock import MagicMock
 
 import pytest
+from services import http_clients
 
 from .factories import SessionFactory, TaskFactory
 
 
+@pytest.fixture(autouse=True)
+def reset_http_clients():
+    """Drop pooled clients so each test sees its own patched httpx.AsyncClient."""
+    http_clients._clients.clear()
+    http_clients._metrics.clear()
+    yield
+    http_clients._clients.clear()
+    http_clients._metrics.clear()
+
+
 @pytest.fixture
 def task_factory():
     """Task factory fixture."""
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from services.context_pipeline import Stage, run_pipeline
+
+
+def _sleeper(seconds: float, value: object = None):
+    async def run(_: dict) -> object:
+        await asyncio.sleep(seconds)
+        return value
+
+    return run
+
+
+async def _fail(_: dict) -> None:
+    raise ConnectionError("dashboard down")
+
+
+class TestRunPipeline:
+    async def test_independent_stages_run_concurrently(self):
+        started = time.perf_counter()
+
+        result = await run_pipeline(
+            [Stage("a", _sleeper(0.1, "A")), Stage("b", _sleeper(0.1, "B"))],
+            deadline_seconds=5,
+        )
+
+        assert time.perf_counter() - started < 0.19
+        assert result.results == {"a": "A", "b": "B"}
+        assert result.timings["a"]["status"] == "ok"
+
+    async def test_dependent_stage_receives_upstream_result(self):
+        async def child(results: dict) -> str:
+            return f"{results['parent']}-child"
+
+        result = await run_pipeline(
+            [Stage("child", child, depends_on=("parent",)), Stage("parent", _sleeper(0, "p"))],
+            deadline_seconds=5,
+        )
+
+        assert result.results["child"] == "p-child"
+
+    async def test_failed_stage_uses_fallback_and_skips_dependents(self):
+        result = await run_pipeline(
+            [
+                Stage("conversation", _fail),
+                Stage("history", _sleeper(0, ["msg"]), depends_on=("conversation",), fallback=[]),
+                Stage("knowledge", _sleeper(0, {"k": 1})),
+            ],
+            deadline_seconds=5,
+        )
+
+        assert result.timings["conversation"]["status"] == "failed"
+        assert result.timings["history"]["status"] == "skipped"
+        assert result.results["history"] == []
+        assert result.results["knowledge"] == {"k": 1}
+
+    async def test_deadline_cancels_slow_stages_with_fallback(self):
+        result = await run_pipeline(
+            [Stage("fast", _sleeper(0, "ok")), Stage("slow", _sleeper(5, "late"), fallback="")],
+            deadline_seconds=0.05,
+        )
+
+        assert result.results == {"fast": "ok", "slow": ""}
+        assert result.timings["slow"]["status"] == "timeout"
+        assert result.total_ms < 1000
+
+    async def test_unknown_dependency_is_rejected(self):
+        with pytest.raises(ValueError, match="unknown"):
+            await run_pipeline([Stage("a", _sleeper(0), depends_on=("missing",))], 1)
+
+
+class TestWebhookContextBuild:
+    async def test_knowledge_fetch_overlaps_dashboard_calls_and_timings_published(self):
+        from worker import TaskWorker
+
+        settings = MagicMock()
+        settings.max_concurrent_tasks = 1
+        settings.context_build_deadline_seconds = 5.0
+        worker = TaskWorker(settings, MagicMock())
+        worker._redis = AsyncMock()
+
+        async def slow_conversation(*_args, **_kwargs) -> str:
+            await asyncio.sleep(0.1)
+            return "conv-1"
+
+        async def slow_knowledge(_task: dict) -> dict:
+            await asyncio.sleep(0.1)
+            return {"knowledge": "kb", "repos": [], "code_snippets": []}
+
+        task = {"task_id": "t-1", "source": "jira", "prompt": "Fix it", "issue": {"key": "K-1"}}
+        with (
+            patch(
+                "worker.conversation_bridge.get_or_create_flow_conversation",
+                side_effect=slow_conversation,
+            ),
+            patch("worker.conversation_bridge.register_task", new_callable=AsyncMock),
+            patch("worker.conversation_bridge.post_system_message", new_callable=AsyncMock),
+            patch(
+                "worker.conversation_bridge.fetch_conversation_context",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+            patch("worker.task_routing.fetch_task_knowledge", side_effect=slow_knowledge),
+            patch(
+                "worker.task_routing.build_task_context",
+                new_callable=AsyncMock,
+                return_value="enriched",
+            ) as mock_build,
+        ):
+            started = time.perf_counter()
+            prompt = await worker._build_webhook_context(task, "http://dash", "t-1", None)
+            elapsed = time.perf_counter() - started
+
+        assert prompt == "enriched"
+        assert elapsed < 0.19
+        assert mock_build.call_args.kwargs["knowledge_ctx"]["knowledge"] == "kb"
+        assert task["_webhook_conversation_id"] == "conv-1"
+        timings = task["_context_stage_timings"]
+        assert set(timings) == {
+            "conversation",
+            "knowledge",
+            "register",
+            "system_message",
+            "history",
+            "prompt",
+        }
+        json.dumps(timings)
@@ -70,7 +70,7 @@ async def test_get_or_create_flow_conversation_existing():
         "issue": {"key": "KAN-6", "summary": "Fix bug"},
     }
 
-    with patch("services.conversation_bridge.httpx.AsyncClient") as mock_client:
+    with patch("services.http_clients.httpx.AsyncClient") as mock_client:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = lambda: {"conversation_id": "conv-123"}
@@ -87,7 +87,7 @@ async def test_get_or_create_flow_conversation_new():
         "issue": {"key": "KAN-7", "summary": "New bug"},
     }
 
-    with patch("services.conversation_bridge.httpx.AsyncClient") as mock_client:
+    with patch("services.http_clients.httpx.AsyncClient") as mock_client:
         mock_get_response = AsyncMock()
         mock_get_response.status_code = 404
 
@@ -106,7 +106,7 @@ async def test_get_or_create_flow_conversation_new():
 
 @pytest.mark.asyncio
 async def test_fetch_conversation_context():
-    with patch("services.conversation_bridge.httpx.AsyncClient") as mock_client:
+    with patch("services.http_clients.httpx.AsyncClient") as mock_client:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = lambda: [
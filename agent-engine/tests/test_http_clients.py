@@ -0,0 +1,107 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from services import http_clients
+
+
+def _response(status_code: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+@pytest.fixture
+def mock_client():
+    with (
+        patch("services.http_clients.httpx.AsyncClient") as mock_cls,
+        patch("services.http_clients.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        client = mock_cls.return_value.__aenter__.return_value
+        client.get = AsyncMock(return_value=_response())
+        client.post = AsyncMock(return_value=_response())
+        client.aclose = AsyncMock()
+        client.mock_cls = mock_cls
+        yield client
+
+
+class TestConnectionPooling:
+    async def test_client_is_reused_across_requests(self, mock_client):
+        await http_clients.request("dashboard", "GET", "http://dashboard/a")
+        await http_clients.request("dashboard", "POST", "http://dashboard/b", json={})
+
+        assert mock_client.mock_cls.call_count == 1
+        assert mock_client.get.await_count == 1
+        assert mock_client.post.await_count == 1
+
+    async def test_each_upstream_gets_its_own_pool(self, mock_client):
+        await http_clients.request("dashboard", "GET", "http://dashboard/a")
+        await http_clients.request("slack", "GET", "http://slack/a")
+
+        assert mock_client.mock_cls.call_count == 2
+        limits = mock_client.mock_cls.call_args.kwargs["limits"]
+        assert limits.max_connections == http_clients.UPSTREAMS["slack"].max_connections
+
+    async def test_aclose_all_closes_pooled_clients(self, mock_client):
+        await http_clients.request("dashboard", "GET", "http://dashboard/a")
+
+        await http_clients.aclose_all()
+
+        mock_client.aclose.assert_awaited_once()
+        assert http_clients._clients == {}
+
+
+class TestRetries:
+    async def test_idempotent_request_retries_transport_errors(self, mock_client):
+        mock_client.get.side_effect = [httpx.ConnectError("refused"), _response()]
+
+        response = await http_clients.request("dashboard", "GET", "http://dashboard/a")
+
+        assert response.status_code == 200
+        assert mock_client.get.await_count == 2
+
+    async def test_post_is_not_retried_by_default(self, mock_client):
+        mock_client.post.side_effect = httpx.ConnectError("refused")
+
+        with pytest.raises(httpx.ConnectError):
+            await http_clients.request("slack", "POST", "http://slack/messages", json={})
+
+        assert mock_client.post.await_count == 1
+
+    async def test_retries_are_bounded(self, mock_client):
+        mock_client.get.return_value = _response(503)
+
+        response = await http_clients.request("dashboard", "GET", "http://dashboard/a")
+
+        assert response.status_code == 503
+        retries = http_clients.UPSTREAMS["dashboard"].retries
+        assert mock_client.get.await_count == 1 + retries
+
+    async def test_opt_in_retry_for_read_only_post(self, mock_client):
+        mock_client.post.side_effect = [httpx.ReadTimeout("slow"), _response()]
+
+        await http_clients.request("knowledge", "POST", "http://llamaindex/query", retry=True)
+
+        assert mock_client.post.await_count == 2
+
+
+class TestMetrics:
+    async def test_metrics_track_requests_errors_and_retries(self, mock_client):
+        mock_client.get.side_effect = [httpx.ConnectError("refused"), _response()]
+
+        await http_clients.request("dashboard", "GET", "http://dashboard/a")
+
+        metrics = http_clients.get_metrics()["dashboard"]
+        assert metrics["requests"] == 2
+        assert metrics["errors"] == 1
+        assert metrics["retries"] == 1
+        assert metrics["p95_ms"] is not None
+        assert metrics["pooled"] is True
+
+
+class TestHttp2:
+    def test_http2_skipped_when_h2_missing(self):
+        with patch("services.http_clients.importlib.util.find_spec", return_value=None):
+            http_clients.configure_http2({"dashboard"})
+
+        assert http_clients._http2_upstreams == set()
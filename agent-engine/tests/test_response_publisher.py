@@ -12,7 +12,7 @@ def _mock_http_client():
 
 
 class TestSlackOpsNotificationOnCompletion:
-    @patch("services.slack_notifier.httpx.AsyncClient")
+    @patch("services.http_clients.httpx.AsyncClient")
     async def test_notify_completed_sends_blocks_with_buttons(self, mock_cls):
         from services.slack_notifier import notify_task_completed
 
@@ -34,7 +34,7 @@ class TestSlackOpsNotificationOnCompletion:
         context_block = payload["blocks"][1]
         assert context_block["type"] == "context"
 
-    @patch("services.slack_notifier.httpx.AsyncClient")
+    @patch("services.http_clients.httpx.AsyncClient")
     async def test_notify_completed_with_view_url_adds_link_button(self, mock_cls):
         from services.slack_notifier import notify_task_completed
 
@@ -56,7 +56,7 @@ class TestSlackOpsNotificationOnCompletion:
         assert button["url"] == "https://github.com/org/repo/issues/42"
         assert button["text"]["text"] == "View"
 
-    @patch("services.slack_notifier.httpx.AsyncClient")
+    @patch("services.http_clients.httpx.AsyncClient")
     async def test_notify_failed_sends_blocks(self, mock_cls):
         from services.slack_notifier import notify_task_failed
 
@@ -92,7 +92,7 @@ class TestSlackOpsNotificationOnCompletion:
 
 
 class TestSlackNotifierHttpErrors:
-    @patch("services.slack_notifier.httpx.AsyncClient")
+    @patch("services.http_clients.httpx.AsyncClient")
     async def test_completion_http_error_returns_false(self, mock_cls):
         import httpx
         from services.slack_notifier import notify_task_completed
@@ -108,7 +108,7 @@ class TestSlackNotifierHttpErrors:
         )
         assert result is False
 
-    @patch("services.slack_notifier.httpx.AsyncClient")
+    @patch("services.http_clients.httpx.AsyncClient")
     async def test_failure_http_error_returns_false(self, mock_cls):
         import httpx
         from services.slack_notifier import notify_task_failed
@@ -135,7 +135,7 @@ class TestCLIHandlesResponsesViaMCP:
     Agent-engine only sends ops Slack notifications, not platform responses.
     """
 
-    @patch("services.slack_notifier.httpx.AsyncClient")
+    @patch("services.http_clients.httpx.AsyncClient")
     async def test_github_task_gets_ops_notification_with_blocks(self, mock_cls):
         from services.slack_notifier import notify_task_completed
 
@@ -150,7 +150,7 @@ class TestCLIHandlesResponsesViaMCP:
         assert "Task Completed" in payload["text"]
         assert "blocks" in payload
 
-    @patch("services.slack_notifier.httpx.AsyncClient")
+    @patch("services.http_clients.httpx.AsyncClient")
     async def test_jira_task_gets_ops_notification_with_blocks(self, mock_cls):
         from services.slack_notifier import notify_task_completed
 
@@ -164,7 +164,7 @@ class TestCLIHandlesResponsesViaMCP:
         assert payload["channel"] == "#ops"
         assert "blocks" in payload
 
-    @patch("services.slack_notifier.httpx.AsyncClient")
+    @patch("services.http_clients.httpx.AsyncClient")
     async def test_slack_task_gets_ops_notification_with_blocks(self, mock_cls):
         from services.slack_notifier import notify_task_completed
 
@@ -180,7 +180,7 @@ class TestCLIHandlesResponsesViaMCP:
 
 
 class TestTaskOutputEventPublishing:
-    @patch("services.slack_notifier.httpx.AsyncClient")
+    @patch("services.http_clients.httpx.AsyncClient")
     @patch("worker.conversation_bridge.post_fallback_notice", new_callable=AsyncMock)
     @patch(
         "worker.conversation_bridge.fetch_conversation_context",
@@ -214,6 +214,7 @@ class TestTaskOutputEventPublishing:
         mock_settings.max_concurrent_tasks = 5
         mock_settings.task_timeout_seconds = 60
         mock_settings.dashboard_api_url = "http://dashboard-api:5000"
+        mock_settings.context_build_deadline_seconds = 10.0
 
         worker = TaskWorker(mock_settings, MagicMock())
         worker._redis = AsyncMock()
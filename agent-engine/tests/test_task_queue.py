@@ -0,0 +1,147 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from services.task_queue import (
+    ATTEMPTS_KEY,
+    DEAD_LETTER_KEY,
+    FLOW_CLOCK_KEY,
+    LEASES_KEY,
+    LEGACY_QUEUE_KEY,
+    PRIORITY_HEAD_START_SECONDS,
+    READY_QUEUE_KEY,
+    ack_task,
+    claim_task,
+    classify_task,
+    enqueue_task,
+    flow_key,
+    heartbeat_leases,
+    reap_expired_leases,
+    release_task,
+)
+
+
+class TestClassifyTask:
+    def test_interactive_sources_are_high_priority(self):
+        assert classify_task({"source": "slack", "event_type": "app_mention"}) == "high"
+        assert classify_task({"prompt": "hi"}) == "high"
+
+    def test_jira_issue_updates_are_low_priority(self):
+        assert classify_task({"source": "jira", "event_type": "jira:issue_updated"}) == "low"
+
+    def test_github_issue_edits_are_low_priority(self):
+        task = {"source": "github", "event_type": "issues", "action": "labeled"}
+        assert classify_task(task) == "low"
+
+    def test_comments_and_reviews_are_normal_priority(self):
+        assert classify_task({"source": "jira", "event_type": "comment_created"}) == "normal"
+        task = {"source": "github", "event_type": "pull_request", "action": "review_requested"}
+        assert classify_task(task) == "normal"
+
+    def test_explicit_priority_overrides_classification(self):
+        task = {"source": "jira", "event_type": "jira:issue_updated", "priority": "high"}
+        assert classify_task(task) == "high"
+
+
+class TestFlowKey:
+    def test_github_flow_is_repository_owner(self):
+        task = {"source": "github", "repository": {"full_name": "acme/api"}}
+        assert flow_key(task) == "github:acme"
+
+    def test_jira_flow_is_project_key(self):
+        task = {"source": "jira", "issue": {"project": {"key": "PROJ"}}}
+        assert flow_key(task) == "jira:PROJ"
+
+    def test_slack_flow_is_team(self):
+        assert flow_key({"source": "slack", "team_id": "T123"}) == "slack:T123"
+
+    def test_missing_org_falls_back_to_default(self):
+        assert flow_key({"source": "github"}) == "github:default"
+
+
+class TestEnqueue:
+    async def test_enqueue_scores_by_flow_and_priority(self):
+        redis_client = MagicMock()
+        redis_client.eval = AsyncMock(return_value=b"1000.0")
+        task = {"task_id": "t-1", "source": "jira", "event_type": "jira:issue_updated"}
+
+        with patch("services.task_queue.time.time", return_value=1000.0):
+            score = await enqueue_task(redis_client, task)
+
+        assert score == 1000.0
+        args = redis_client.eval.call_args[0]
+        assert args[2:4] == (READY_QUEUE_KEY, FLOW_CLOCK_KEY)
+        assert json.loads(args[4])["priority"] == "low"
+        assert args[5] == "jira:default"
+        assert args[8] == PRIORITY_HEAD_START_SECONDS["low"]
+
+    async def test_lighter_sources_advance_flow_clock_faster(self):
+        redis_client = MagicMock()
+        redis_client.eval = AsyncMock(return_value="0")
+
+        await enqueue_task(redis_client, {"source": "jira"})
+        jira_cost = redis_client.eval.call_args[0][7]
+        await enqueue_task(redis_client, {"source": "slack"})
+        slack_cost = redis_client.eval.call_args[0][7]
+
+        assert jira_cost > slack_cost
+
+
+class TestLeases:
+    async def test_claim_returns_payload_and_attempt_count(self):
+        redis_client = MagicMock()
+        redis_client.eval = AsyncMock(return_value=[b"task", 2])
+
+        claimed = await claim_task(redis_client, "worker-1", lease_seconds=60)
+
+        assert claimed is not None
+        assert claimed.payload == b"task"
+        assert claimed.attempts == 2
+        args = redis_client.eval.call_args[0]
+        assert args[2:6] == (LEGACY_QUEUE_KEY, READY_QUEUE_KEY, LEASES_KEY, ATTEMPTS_KEY)
+        assert args[6] == claimed.lease_id
+
+    async def test_claim_returns_none_when_queue_empty(self):
+        redis_client = MagicMock()
+        redis_client.eval = AsyncMock(return_value=None)
+
+        assert await claim_task(redis_client, "worker-1", lease_seconds=60) is None
+
+    async def test_heartbeat_reports_lost_leases(self):
+        redis_client = MagicMock()
+        redis_client.eval = AsyncMock(return_value=[b"lease-2"])
+
+        lost = await heartbeat_leases(redis_client, ["lease-1", "lease-2"], lease_seconds=60)
+
+        assert lost == ["lease-2"]
+        assert redis_client.eval.call_args[0][-2:] == ("lease-1", "lease-2")
+
+    async def test_heartbeat_skips_redis_without_leases(self):
+        redis_client = MagicMock()
+        redis_client.eval = AsyncMock()
+
+        assert await heartbeat_leases(redis_client, [], lease_seconds=60) == []
+        redis_client.eval.assert_not_awaited()
+
+    async def test_reap_returns_requeued_count_and_dead_letters(self):
+        redis_client = MagicMock()
+        redis_client.eval = AsyncMock(return_value=[1, [b"dead-task"]])
+
+        requeued, dead = await reap_expired_leases(redis_client, max_attempts=3)
+
+        assert requeued == 1
+        assert dead == [b"dead-task"]
+        assert DEAD_LETTER_KEY in redis_client.eval.call_args[0]
+
+    async def test_release_expires_lease_immediately(self):
+        redis_client = MagicMock()
+        redis_client.zadd = AsyncMock()
+
+        await release_task(redis_client, "lease-1")
+
+        redis_client.zadd.assert_awaited_once_with(LEASES_KEY, {"lease-1": 0}, xx=True)
+
+    async def test_ack_reports_whether_lease_was_held(self):
+        redis_client = MagicMock()
+        redis_client.eval = AsyncMock(return_value=0)
+
+        assert await ack_task(redis_client, "lease-1") is False
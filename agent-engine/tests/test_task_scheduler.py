@@ -0,0 +1,278 @@
+import asyncio
+import json
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+class FakeTaskQueue:
+    def __init__(self, items: list[bytes]):
+        self.items = list(items)
+        self.acked: list[str] = []
+        self.released: list[str] = []
+        self._next_lease = 0
+
+    async def claim_task(self, redis_client, worker_id: str, lease_seconds: float):
+        from services.task_queue import ClaimedTask
+
+        if not self.items:
+            return None
+        self._next_lease += 1
+        return ClaimedTask(
+            lease_id=f"lease-{self._next_lease}", payload=self.items.pop(0), attempts=1
+        )
+
+    async def ack_task(self, redis_client, lease_id: str) -> bool:
+        self.acked.append(lease_id)
+        return True
+
+    async def release_task(self, redis_client, lease_id: str) -> None:
+        self.released.append(lease_id)
+
+    async def heartbeat_leases(self, redis_client, lease_ids, lease_seconds):
+        return []
+
+    async def reap_expired_leases(self, redis_client, max_attempts, limit=100):
+        return 0, []
+
+
+def _settings(max_concurrent: int = 2, grace: float = 5.0) -> MagicMock:
+    settings = MagicMock()
+    settings.redis_url = "redis://localhost:6379/0"
+    settings.max_concurrent_tasks = max_concurrent
+    settings.shutdown_grace_seconds = grace
+    settings.task_lease_seconds = 60.0
+    settings.task_heartbeat_seconds = 0.01
+    settings.task_max_attempts = 3
+    settings.queue_poll_interval_seconds = 0.01
+    settings.event_batch_size = 100
+    settings.event_flush_interval_seconds = 0.01
+    settings.event_buffer_max = 1000
+    settings.event_overflow_policy = "merge"
+    return settings
+
+
+def _tasks(count: int) -> list[bytes]:
+    return [json.dumps({"task_id": f"task-{i}"}).encode() for i in range(count)]
+
+
+@contextmanager
+def _patched_queue(queue: FakeTaskQueue):
+    redis_client = AsyncMock()
+    with (
+        patch("worker.redis.from_url", return_value=redis_client),
+        patch("worker.claim_task", queue.claim_task),
+        patch("worker.ack_task", queue.ack_task),
+        patch("worker.release_task", queue.release_task),
+        patch("worker.heartbeat_leases", queue.heartbeat_leases),
+        patch("worker.reap_expired_leases", queue.reap_expired_leases),
+    ):
+        yield
+
+
+async def _wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+class TestBoundedConcurrency:
+    async def test_in_flight_tasks_never_exceed_max_slots(self):
+        from worker import TaskWorker
+
+        worker = TaskWorker(_settings(max_concurrent=2), MagicMock())
+        active = 0
+        peak = 0
+        done: list[str] = []
+
+        async def fake_process(task_data: bytes) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            done.append(json.loads(task_data)["task_id"])
+
+        worker._process_task = fake_process
+        queue = FakeTaskQueue(_tasks(6))
+
+        with _patched_queue(queue):
+            loop_task = asyncio.create_task(worker.start())
+            await _wait_until(lambda: len(done) == 6)
+            await worker.stop()
+            loop_task.cancel()
+
+        assert peak == 2
+        assert len(done) == 6
+
+    async def test_queue_not_polled_while_all_slots_busy(self):
+        from worker import TaskWorker
+
+        worker = TaskWorker(_settings(max_concurrent=1), MagicMock())
+        release = asyncio.Event()
+
+        async def blocking_process(task_data: bytes) -> None:
+            await release.wait()
+
+        worker._process_task = blocking_process
+        queue = FakeTaskQueue(_tasks(3))
+
+        with _patched_queue(queue):
+            loop_task = asyncio.create_task(worker.start())
+            await _wait_until(lambda: worker.active_tasks == 1)
+            await asyncio.sleep(0.05)
+
+            assert len(queue.items) == 2
+
+            release.set()
+            await _wait_until(lambda: len(queue.acked) == 3)
+            await worker.stop()
+            loop_task.cancel()
+
+
+class TestLeases:
+    async def test_completed_tasks_are_acked(self):
+        from worker import TaskWorker
+
+        worker = TaskWorker(_settings(), MagicMock())
+        worker._process_task = AsyncMock()
+        queue = FakeTaskQueue(_tasks(2))
+
+        with _patched_queue(queue):
+            loop_task = asyncio.create_task(worker.start())
+            await _wait_until(lambda: len(queue.acked) == 2)
+            await worker.stop()
+            loop_task.cancel()
+
+        assert queue.acked == ["lease-1", "lease-2"]
+        assert queue.released == []
+
+    async def test_in_flight_leases_are_heartbeated(self):
+        from worker import TaskWorker
+
+        worker = TaskWorker(_settings(), MagicMock())
+        release = asyncio.Event()
+        heartbeats: list[list[str]] = []
+
+        async def blocking_process(task_data: bytes) -> None:
+            await release.wait()
+
+        async def record_heartbeat(redis_client, lease_ids, lease_seconds):
+            heartbeats.append(list(lease_ids))
+            return []
+
+        worker._process_task = blocking_process
+        queue = FakeTaskQueue(_tasks(1))
+        queue.heartbeat_leases = record_heartbeat
+
+        with _patched_queue(queue):
+            loop_task = asyncio.create_task(worker.start())
+            await _wait_until(lambda: ["lease-1"] in heartbeats)
+            release.set()
+            await worker.stop()
+            loop_task.cancel()
+
+    async def test_dead_lettered_tasks_are_marked_failed(self):
+        from worker import TaskWorker
+
+        worker = TaskWorker(_settings(), MagicMock())
+        queue = FakeTaskQueue([])
+        dead = [json.dumps({"task_id": "task-dead"}).encode()]
+
+        async def reap_once(redis_client, max_attempts, limit=100):
+            payloads = list(dead)
+            dead.clear()
+            return 0, payloads
+
+        queue.reap_expired_leases = reap_once
+
+        with (
+            _patched_queue(queue),
+            patch("worker.update_task_status", new_callable=AsyncMock) as mock_status,
+            patch("worker.publish_task_event", new_callable=AsyncMock) as mock_event,
+        ):
+            loop_task = asyncio.create_task(worker.start())
+            await _wait_until(lambda: mock_status.await_count == 1)
+            await worker.stop()
+            loop_task.cancel()
+
+        assert mock_status.call_args[0][1:3] == ("task-dead", "failed")
+        assert mock_event.call_args[0][2] == "task:failed"
+
+
+class TestGracefulDrain:
+    async def test_stop_waits_for_in_flight_tasks(self):
+        from worker import TaskWorker
+
+        worker = TaskWorker(_settings(max_concurrent=2), MagicMock())
+        finished: list[str] = []
+
+        async def slow_process(task_data: bytes) -> None:
+            await asyncio.sleep(0.1)
+            finished.append(json.loads(task_data)["task_id"])
+
+        worker._process_task = slow_process
+        queue = FakeTaskQueue(_tasks(2))
+
+        with _patched_queue(queue):
+            loop_task = asyncio.create_task(worker.start())
+            await _wait_until(lambda: worker.active_tasks == 2)
+            await worker.stop()
+            loop_task.cancel()
+
+        assert sorted(finished) == ["task-0", "task-1"]
+        assert worker.active_tasks == 0
+
+    async def test_tasks_exceeding_grace_period_are_cancelled_and_released(self):
+        from worker import TaskWorker
+
+        worker = TaskWorker(_settings(max_concurrent=1, grace=0.05), MagicMock())
+        cancelled = asyncio.Event()
+
+        async def stuck_process(task_data: bytes) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        worker._process_task = stuck_process
+        queue = FakeTaskQueue(_tasks(1))
+
+        with _patched_queue(queue):
+            loop_task = asyncio.create_task(worker.start())
+            await _wait_until(lambda: worker.active_tasks == 1)
+            await worker.stop()
+            loop_task.cancel()
+
+        assert cancelled.is_set()
+        assert queue.released == ["lease-1"]
+        assert queue.acked == []
+
+
+class TestSchedulerStats:
+    async def test_stats_report_slots_and_queue_depth(self):
+        from worker import TaskWorker
+
+        worker = TaskWorker(_settings(max_concurrent=3), MagicMock())
+        worker._redis = AsyncMock()
+        worker._redis.zcard = AsyncMock(return_value=5)
+        worker._redis.llen = AsyncMock(return_value=2)
+
+        stats = await worker.get_stats()
+
+        assert stats["max_slots"] == 3
+        assert stats["active_slots"] == 0
+        assert stats["free_slots"] == 3
+        assert stats["queue_depth"] == 7
+
+    async def test_stats_tolerate_redis_errors(self):
+        from worker import TaskWorker
+
+        worker = TaskWorker(_settings(), MagicMock())
+        worker._redis = AsyncMock()
+        worker._redis.zcard = AsyncMock(side_effect=ConnectionError("down"))
+
+        stats = await worker.get_stats()
+
+        assert stats["queue_depth"] is None
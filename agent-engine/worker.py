@@ -1,22 +1,42 @@
 import asyncio
 import os
 import re
+import socket
 import time
+from contextlib import suppress
 from typing import Any
 
 import redis.asyncio as redis
 import structlog
 from services import conversation_bridge, task_routing
+from services.context_pipeline import Stage, run_pipeline
 from services.dashboard_client import post_assistant_message, update_dashboard_task
+from services.event_batcher import BatchingEventPublisher
 from services.knowledge import KnowledgeService, NoopKnowledgeService
 from services.loop_tracking import extract_posted_comment_ids, track_posted_comments
 from services.output_validation import clean_agent_output, detect_auth_failure
-from services.redis_ops import persist_output, publish_task_event, update_task_status
+from services.redis_ops import (
+    persist_output,
+    publish_task_event,
+    set_event_batcher,
+    update_task_status,
+)
 from services.slack_notifier import (
     get_notification_channel,
     notify_task_completed,
     notify_task_failed,
 )
+from services.task_queue import (
+    ClaimedTask,
+    ack_task,
+    claim_task,
+    heartbeat_leases,
+    lease_stats,
+    queue_depth,
+    reap_expired_leases,
+    release_task,
+)
+from services.task_routing import EMPTY_KNOWLEDGE_CONTEXT
 
 logger = structlog.get_logger(__name__)
 
@@ -72,25 +92,144 @@ class TaskWorker:
         self._redis: redis.Redis | None = None
         self._running = False
         self._knowledge = knowledge_service
+        self._max_slots: int = settings.max_concurrent_tasks
+        self._slots = asyncio.Semaphore(self._max_slots)
+        self._in_flight: dict[asyncio.Task[None], str] = {}
+        self._started_total = 0
+        self._worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._lease_task: asyncio.Task[None] | None = None
+        self._events: BatchingEventPublisher | None = None
 
     async def start(self) -> None:
         self._redis = redis.from_url(self._settings.redis_url)
         self._running = True
-        logger.info("task_worker_started", max_concurrent=self._settings.max_concurrent_tasks)
-
-        semaphore = asyncio.Semaphore(self._settings.max_concurrent_tasks)
+        self._events = BatchingEventPublisher(
+            self._redis,
+            max_batch_size=self._settings.event_batch_size,
+            flush_interval_seconds=self._settings.event_flush_interval_seconds,
+            max_buffer_size=self._settings.event_buffer_max,
+            overflow_policy=self._settings.event_overflow_policy,
+        )
+        self._events.start()
+        set_event_batcher(self._events)
+        self._lease_task = asyncio.create_task(self._maintain_leases())
+        logger.info(
+            "task_worker_started", max_concurrent=self._max_slots, worker_id=self._worker_id
+        )
 
         while self._running:
+            await self._slots.acquire()
             try:
-                task_data = await self._redis.brpop("agent:tasks", timeout=1)
-                if task_data:
-                    async with semaphore:
-                        asyncio.create_task(self._process_task(task_data[1]))
+                claimed = await claim_task(
+                    self._redis, self._worker_id, self._settings.task_lease_seconds
+                )
             except asyncio.CancelledError:
+                self._slots.release()
                 break
             except Exception as e:
+                self._slots.release()
                 logger.exception("worker_error", error=str(e))
                 await asyncio.sleep(1)
+                continue
+
+            if not claimed:
+                self._slots.release()
+                await asyncio.sleep(self._settings.queue_poll_interval_seconds)
+                continue
+
+            if not self._running:
+                await release_task(self._redis, claimed.lease_id)
+                self._slots.release()
+                break
+
+            self._spawn(claimed)
+
+    def _spawn(self, claimed: ClaimedTask) -> None:
+        task = asyncio.create_task(self._run_claimed(claimed))
+        self._in_flight[task] = claimed.lease_id
+        self._started_total += 1
+        task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        self._in_flight.pop(task, None)
+        self._slots.release()
+
+    async def _run_claimed(self, claimed: ClaimedTask) -> None:
+        if claimed.attempts > 1:
+            logger.info("task_redelivered", lease_id=claimed.lease_id, attempt=claimed.attempts)
+        try:
+            await self._process_task(claimed.payload)
+        except asyncio.CancelledError:
+            with suppress(Exception):
+                await release_task(self._redis, claimed.lease_id)
+            raise
+
+        try:
+            await ack_task(self._redis, claimed.lease_id)
+        except Exception as e:
+            logger.warning("task_ack_failed", lease_id=claimed.lease_id, error=str(e))
+
+    async def _maintain_leases(self) -> None:
+        interval = self._settings.task_heartbeat_seconds
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                lost = await heartbeat_leases(
+                    self._redis, list(self._in_flight.values()), self._settings.task_lease_seconds
+                )
+                if lost:
+                    logger.warning("task_leases_lost", lease_ids=lost)
+
+                requeued, dead = await reap_expired_leases(
+                    self._redis, self._settings.task_max_attempts
+                )
+                if requeued:
+                    logger.info("task_leases_requeued", count=requeued)
+                for payload in dead:
+                    await self._dead_letter(payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("task_lease_maintenance_failed", error=str(e))
+
+    async def _dead_letter(self, payload: bytes) -> None:
+        import json
+
+        try:
+            task_id = json.loads(payload).get("task_id", "unknown")
+        except (ValueError, AttributeError):
+            task_id = "unknown"
+        error = f"Task abandoned after {self._settings.task_max_attempts} attempts"
+        logger.error("task_dead_lettered", task_id=task_id)
+        await update_task_status(self._redis, task_id, "failed", {"error": error})
+        await publish_task_event(
+            self._redis, task_id, "task:failed", {"task_id": task_id, "error": error}
+        )
+
+    @property
+    def active_tasks(self) -> int:
+        return len(self._in_flight)
+
+    async def get_stats(self) -> dict[str, Any]:
+        depth: int | None = None
+        leases: dict[str, int] = {}
+        if self._redis:
+            try:
+                depth = await queue_depth(self._redis)
+                leases = await lease_stats(self._redis)
+            except Exception as e:
+                logger.warning("queue_depth_read_failed", error=str(e))
+        return {
+            "running": self._running,
+            "worker_id": self._worker_id,
+            "max_slots": self._max_slots,
+            "active_slots": self.active_tasks,
+            "free_slots": self._max_slots - self.active_tasks,
+            "tasks_started": self._started_total,
+            "queue_depth": depth,
+            **leases,
+            "events": self._events.get_stats() if self._events else None,
+        }
 
     async def _process_task(self, task_data: bytes) -> None:
         import json
@@ -147,6 +286,7 @@ class TaskWorker:
                         "flow_id": conversation_bridge.build_flow_id(task),
                         "conversation_id": webhook_conversation_id,
                         "source_metadata": {"source": source, "event_type": event_type_key},
+                        "stage_timings": task.pop("_context_stage_timings", {}),
                     },
                 )
 
@@ -279,32 +419,71 @@ class TaskWorker:
         flow_id = conversation_bridge.build_flow_id(task)
         logger.info("webhook_flow_started", task_id=task_id, flow_id=flow_id)
 
-        webhook_conversation_id = await conversation_bridge.get_or_create_flow_conversation(
-            dashboard_url, task
-        )
-        logger.info(
-            "webhook_conversation_ready", task_id=task_id, conversation_id=webhook_conversation_id
-        )
+        async def conversation(_: dict[str, Any]) -> str:
+            conversation_id = await conversation_bridge.get_or_create_flow_conversation(
+                dashboard_url, task
+            )
+            logger.info(
+                "webhook_conversation_ready", task_id=task_id, conversation_id=conversation_id
+            )
+            return conversation_id
 
-        await conversation_bridge.register_task(dashboard_url, task, webhook_conversation_id)
-        logger.info("webhook_task_registered", task_id=task_id, session_id=session_id)
+        async def register(results: dict[str, Any]) -> None:
+            await conversation_bridge.register_task(dashboard_url, task, results["conversation"])
+            logger.info("webhook_task_registered", task_id=task_id, session_id=session_id)
 
-        await conversation_bridge.post_system_message(
-            dashboard_url, webhook_conversation_id, task, task_id=task_id
+        async def system_message(results: dict[str, Any]) -> None:
+            await conversation_bridge.post_system_message(
+                dashboard_url, results["conversation"], task, task_id=task_id
+            )
+
+        async def history(results: dict[str, Any]) -> list[dict]:
+            conversation_context = await conversation_bridge.fetch_conversation_context(
+                dashboard_url,
+                results["conversation"],
+                limit=5,
+                roles="user,assistant",
+            )
+            logger.info(
+                "webhook_context_fetched",
+                task_id=task_id,
+                messages_count=len(conversation_context),
+            )
+            return conversation_context
+
+        async def knowledge(_: dict[str, Any]) -> dict[str, Any]:
+            return await task_routing.fetch_task_knowledge(task)
+
+        pipeline = await run_pipeline(
+            [
+                Stage("conversation", conversation),
+                Stage("knowledge", knowledge, fallback=EMPTY_KNOWLEDGE_CONTEXT),
+                Stage("register", register, depends_on=("conversation",)),
+                Stage("system_message", system_message, depends_on=("register",)),
+                Stage("history", history, depends_on=("conversation",), fallback=[]),
+            ],
+            deadline_seconds=self._settings.context_build_deadline_seconds,
+            log_context={"task_id": task_id},
         )
 
-        conversation_context = await conversation_bridge.fetch_conversation_context(
-            dashboard_url,
-            webhook_conversation_id,
-            limit=5,
-            roles="user,assistant",
+        task["_webhook_conversation_id"] = pipeline.results["conversation"]
+        task["_context_stage_timings"] = pipeline.timings
+
+        started = time.perf_counter()
+        prompt = await task_routing.build_task_context(
+            task, pipeline.results["history"], knowledge_ctx=pipeline.results["knowledge"]
         )
+        pipeline.timings["prompt"] = {
+            "status": "ok",
+            "ms": round((time.perf_counter() - started) * 1000, 1),
+        }
         logger.info(
-            "webhook_context_fetched", task_id=task_id, messages_count=len(conversation_context)
+            "webhook_context_built",
+            task_id=task_id,
+            total_ms=pipeline.total_ms,
+            stages={name: timing["status"] for name, timing in pipeline.timings.items()},
         )
-
-        task["_webhook_conversation_id"] = webhook_conversation_id
-        return await task_routing.build_task_context(task, conversation_context)
+        return prompt
 
     async def _publish_raw_output(self, task_id: str, result: dict[str, Any]) -> None:
         raw_for_event = result.get("raw_output", result.get("output", ""))
@@ -423,6 +602,27 @@ class TaskWorker:
 
     async def stop(self) -> None:
         self._running = False
+        await self._drain()
+        if self._lease_task:
+            self._lease_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._lease_task
+        if self._events:
+            await self._events.stop()
+            set_event_batcher(None)
         if self._redis:
             await self._redis.aclose()
         logger.info("task_worker_stopped")
+
+    async def _drain(self) -> None:
+        if not self._in_flight:
+            return
+        grace = self._settings.shutdown_grace_seconds
+        logger.info("task_worker_draining", in_flight=len(self._in_flight), grace_seconds=grace)
+        _, pending = await asyncio.wait(set(self._in_flight), timeout=grace)
+        if not pending:
+            return
+        logger.warning("task_worker_drain_timeout", cancelled=len(pending))
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
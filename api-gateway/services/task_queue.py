@@ -0,0 +1,97 @@
+import json
+import time
+from typing import Any
+
+import redis.asyncio as redis
+
+READY_QUEUE_KEY = "agent:tasks:ready"
+FLOW_CLOCK_KEY = "agent:tasks:flow_clock"
+FLOW_CLOCK_TTL_SECONDS = 86400
+
+# Each flow (source + org) advances its own virtual clock by
+# FLOW_SERVICE_SECONDS / weight per task, so a burst from one flow is spread
+# out behind the tasks of quieter flows instead of blocking them.
+FLOW_SERVICE_SECONDS = 60.0
+SOURCE_WEIGHTS = {"slack": 4.0, "dashboard": 4.0, "github": 2.0, "jira": 1.0}
+DEFAULT_SOURCE_WEIGHT = 1.0
+
+# Priority lanes are a head start subtracted from the score. Scores are
+# wall-clock based, so a low-priority task can only be overtaken by work that
+# arrived less than this long after it, which bounds starvation (aging).
+PRIORITY_HEAD_START_SECONDS = {"high": 600.0, "normal": 120.0, "low": 0.0}
+DEFAULT_PRIORITY = "normal"
+
+HIGH_PRIORITY_SOURCES = {"slack", "dashboard"}
+LOW_PRIORITY_EVENTS = {("jira", "jira:issue_updated"), ("github", "push")}
+LOW_PRIORITY_GITHUB_ISSUE_ACTIONS = {"edited", "labeled"}
+
+_ENQUEUE_SCRIPT = """
+local now = tonumber(ARGV[3])
+local clock = tonumber(redis.call('HGET', KEYS[2], ARGV[2]) or '0')
+local start = math.max(clock, now)
+redis.call('HSET', KEYS[2], ARGV[2], tostring(start + tonumber(ARGV[4])))
+redis.call('EXPIRE', KEYS[2], tonumber(ARGV[6]))
+local score = start - tonumber(ARGV[5])
+redis.call('ZADD', KEYS[1], score, ARGV[1])
+return tostring(score)
+"""
+
+
+def classify_task(task_info: dict[str, Any]) -> str:
+    explicit = task_info.get("priority")
+    if explicit in PRIORITY_HEAD_START_SECONDS:
+        return explicit
+
+    source = task_info.get("source", "dashboard")
+    event_type = task_info.get("event_type")
+
+    if source in HIGH_PRIORITY_SOURCES:
+        return "high"
+    if (source, event_type) in LOW_PRIORITY_EVENTS:
+        return "low"
+    if (
+        source == "github"
+        and event_type == "issues"
+        and task_info.get("action") in LOW_PRIORITY_GITHUB_ISSUE_ACTIONS
+    ):
+        return "low"
+    return DEFAULT_PRIORITY
+
+
+def flow_key(task_info: dict[str, Any]) -> str:
+    source = task_info.get("source", "dashboard")
+    org: str | None = None
+
+    if source == "github":
+        full_name = (task_info.get("repository") or {}).get("full_name") or ""
+        org = full_name.split("/", 1)[0] or None
+    elif source == "jira":
+        project = ((task_info.get("issue") or {}).get("project")) or {}
+        org = project.get("key") or task_info.get("jira_base_url")
+    elif source == "slack":
+        org = task_info.get("team_id")
+
+    return f"{source}:{org or 'default'}"
+
+
+async def enqueue_task(redis_client: redis.Redis, task_info: dict[str, Any]) -> float:
+    priority = classify_task(task_info)
+    task_info["priority"] = priority
+    flow = flow_key(task_info)
+    cost = FLOW_SERVICE_SECONDS / SOURCE_WEIGHTS.get(
+        task_info.get("source", "dashboard"), DEFAULT_SOURCE_WEIGHT
+    )
+
+    score = await redis_client.eval(
+        _ENQUEUE_SCRIPT,
+        2,
+        READY_QUEUE_KEY,
+        FLOW_CLOCK_KEY,
+        json.dumps(task_info),
+        flow,
+        time.time(),
+        cost,
+        PRIORITY_HEAD_START_SECONDS[priority],
+        FLOW_CLOCK_TTL_SECONDS,
+    )
+    return float(score)
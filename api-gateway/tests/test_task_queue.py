@@ -0,0 +1,45 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from services.task_queue import READY_QUEUE_KEY, classify_task, enqueue_task, flow_key
+from webhooks.github.events import extract_task_info as extract_github_task_info
+from webhooks.slack.events import extract_task_info as extract_slack_task_info
+
+from .fixtures import github_issue_opened_payload, slack_app_mention_payload
+
+
+class TestWebhookTaskClassification:
+    def test_slack_mention_is_high_priority(self):
+        payload = slack_app_mention_payload()
+        task_info = extract_slack_task_info(payload["event"], payload.get("team_id"))
+
+        assert classify_task(task_info) == "high"
+
+    def test_github_issue_flow_is_scoped_to_owner(self):
+        payload = github_issue_opened_payload()
+        task_info = extract_github_task_info("issues", payload)
+
+        owner = payload["repository"]["full_name"].split("/")[0]
+        assert flow_key(task_info) == f"github:{owner}"
+        assert classify_task(task_info) == "normal"
+
+
+class TestEnqueueTask:
+    async def test_enqueue_writes_to_ready_queue(self, mock_redis_client):
+        mock_redis_client.eval = AsyncMock(return_value=b"42.5")
+        task_info = {"task_id": "t-1", "source": "github", "event_type": "push"}
+
+        score = await enqueue_task(mock_redis_client, task_info)
+
+        assert score == 42.5
+        args = mock_redis_client.eval.call_args[0]
+        assert args[2] == READY_QUEUE_KEY
+        assert json.loads(args[4])["priority"] == "low"
+
+    async def test_enqueue_errors_propagate_to_handler(self):
+        redis_client = MagicMock()
+        redis_client.eval = AsyncMock(side_effect=ConnectionError("down"))
+
+        with pytest.raises(ConnectionError):
+            await enqueue_task(redis_client, {"source": "slack"})
@@ -13,6 +13,7 @@ from services.slack_notifier import (
     notify_task_failed,
     notify_task_started,
 )
+from services.task_queue import enqueue_task
 
 from .events import extract_task_info, should_process_event
 from .response import send_error_response, send_immediate_response
@@ -160,7 +161,7 @@ async def handle_slack_webhook(request: Request):
 
     try:
         redis_client = redis.from_url(settings.redis_url)
-        await redis_client.lpush("agent:tasks", json.dumps(task_info))
+        await enqueue_task(redis_client, task_info)
         await redis_client.aclose()
     except Exception as e:
         logger.error("slack_task_queue_failed", error=str(e), task_id=task_id)
@@ -11,6 +11,23 @@ from core.config import settings
 
 logger = structlog.get_logger()
 
+# Dashboard chat is interactive: high-priority lane, weight 4 (see agent-engine task_queue).
+AGENT_TASK_PRIORITY = "high"
+AGENT_TASK_HEAD_START_SECONDS = 600.0
+AGENT_TASK_FLOW_COST_SECONDS = 15.0
+AGENT_TASK_FLOW_CLOCK_TTL_SECONDS = 86400
+
+_ENQUEUE_AGENT_TASK_SCRIPT = """
+local now = tonumber(ARGV[3])
+local clock = tonumber(redis.call('HGET', KEYS[2], ARGV[2]) or '0')
+local start = math.max(clock, now)
+redis.call('HSET', KEYS[2], ARGV[2], tostring(start + tonumber(ARGV[4])))
+redis.call('EXPIRE', KEYS[2], tonumber(ARGV[6]))
+local score = start - tonumber(ARGV[5])
+redis.call('ZADD', KEYS[1], score, ARGV[1])
+return tostring(score)
+"""
+
 
 class RedisKeys:
     """Redis key patterns for various data types."""
@@ -21,6 +38,10 @@ class RedisKeys:
     TASK_PID = "task:{id}:pid"
     TASK_OUTPUT = "task:{id}:output"
 
+    # Agent engine fair-share queue (score = flow virtual start - priority head start)
+    AGENT_TASKS_READY = "agent:tasks:ready"
+    AGENT_TASKS_FLOW_CLOCK = "agent:tasks:flow_clock"
+
     # Session management
     SESSION_TASKS = "session:{id}:tasks"
 
@@ -83,10 +104,22 @@ class RedisClient:
         logger.debug("Task pushed to queue", task_id=task_id)
 
     async def push_agent_task(self, task_data: dict) -> None:
-        """Push full task data to agent engine queue."""
-        if not self._client:
-            raise RuntimeError("Redis not connected")
-        await self._client.lpush("agent:tasks", json.dumps(task_data))
+        """Enqueue full task data on the agent engine fair-share queue."""
+        if not self._client:
+            raise RuntimeError("Redis not connected")
+        task_data.setdefault("priority", AGENT_TASK_PRIORITY)
+        await self._client.eval(
+            _ENQUEUE_AGENT_TASK_SCRIPT,
+            2,
+            RedisKeys.AGENT_TASKS_READY,
+            RedisKeys.AGENT_TASKS_FLOW_CLOCK,
+            json.dumps(task_data),
+            "dashboard:default",
+            datetime.now(UTC).timestamp(),
+            AGENT_TASK_FLOW_COST_SECONDS,
+            AGENT_TASK_HEAD_START_SECONDS,
+            AGENT_TASK_FLOW_CLOCK_TTL_SECONDS,
+        )
         logger.debug("Agent task pushed", task_id=task_data.get("task_id"))
 
     async def pop_task(self, timeout: int = 30) -> str | None: